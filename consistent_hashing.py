@@ -1,6 +1,6 @@
-import hashlib
-import bisect
-import mmh3
+import numpy as np
+
+from ring_hash import ring_hash
 
 class ConsistentHashRing:
     def __init__(self, nodes=None, vnodes=100):
@@ -11,79 +11,126 @@ class ConsistentHashRing:
         """
         self.vnodes = vnodes
         
-        # This list stores the sorted hash values of all virtual nodes (the 'Ring').
-        self.ring = []        
-        
-        # Map to link a specific hash value back to the actual physical node name.
-        self.nodes_map = {}   
+        # Packed uint64 array of the sorted hash values of all virtual nodes (the 'Ring').
+        # XXH3 hashes are 64-bit, so this avoids one boxed Python int per vnode.
+        self.ring = np.empty(0, dtype=np.uint64)
+
+        # Physical node names, in the order they were added; a node's position in
+        # this list is its owner id.
+        self.node_names = []
+
+        # Parallel array: owners[i] is the owner id of ring[i]. Keeping the owner inline
+        # with the sorted ring replaces a hash -> node dict, so a lookup is one binary
+        # search plus two reads. Ids (not names) go in the array, so names that are
+        # themselves sequences (e.g. ("10.0.0.1", 6379)) are never unpacked by NumPy.
+        self.owners = np.empty(0, dtype=np.int32)
 
         # If an initial list of nodes is provided, populate the ring immediately.
+        # All nodes are placed first and the ring is sorted once at the end.
         if nodes:
-            for node in nodes:
-                self.add_node(node)
-
-    # def _hash(self, key):
-    #     """
-    #     Generates a 128-bit integer hash for a given string key.
-    #     We use MD5 for stability across different processes/restarts.
-    #     """
-    #     return int(hashlib.md5(key.encode('utf-8')).hexdigest(), 16)
+            self._bulk_add(nodes)
 
     def _hash(self, key):
-        # mmh3.hash returns a 32-bit integer by default. 
-        # It's non-cryptographic, lightning fast, and has high entropy.
-        return mmh3.hash(key)
+        # XXH3 (unsigned 64-bit); faster than MurmurHash3, see ring_hash.py.
+        return ring_hash(key)
+
+    def _bulk_add(self, nodes):
+        """
+        Places several physical nodes on the ring with a single sort at the end.
+        """
+        nodes = list(nodes)
+
+        # The vnode index suffixes are identical for every node, so build them once per
+        # call. Keys are raw bytes: str(node name) encoded (so integer ids work too), "#",
+        # then the vnode index as 4 little-endian bytes (e.g., b"server-1#\x00\x00\x00\x00"),
+        # which skips per-vnode str formatting and encoding.
+        suffixes = [b"#" + i.to_bytes(4, "little") for i in range(self.vnodes)]
+        vnode_keys = [prefix + suffix for prefix in (str(n).encode() for n in nodes) for suffix in suffixes]
+
+        # Collect unsorted: bisect.insort would shift the ring on every insert,
+        # making a ring of K nodes O((K*V)^2) to build. The hashes go straight into a packed array.
+        new_hashes = np.fromiter(map(self._hash, vnode_keys), dtype=np.uint64, count=len(vnode_keys))
+
+        # Keys were generated node by node, so the owners are each new id repeated V times.
+        first_id = len(self.node_names)
+        self.node_names.extend(nodes)
+        new_owners = np.repeat(np.arange(first_id, first_id + len(nodes), dtype=np.int32), self.vnodes)
+
+        # Sort only the new vnodes, then merge them into the already sorted ring in
+        # one pass (O(N + V)) instead of re-sorting all N + V entries. This keeps the
+        # invariant needed for binary search in get_node; inserting the names at the
+        # same positions keeps owners aligned with the ring.
+        order = np.argsort(new_hashes, kind="stable")
+        new_hashes = new_hashes[order]
+        positions = self.ring.searchsorted(new_hashes)
+        self.ring = np.insert(self.ring, positions, new_hashes)
+        self.owners = np.insert(self.owners, positions, new_owners[order])
 
     def add_node(self, node_name):
         """
         Places a physical node on the ring by creating multiple virtual nodes (vnodes).
         """
-        for i in range(self.vnodes):
-            # Create a unique string for each virtual node (e.g., "server-1#0", "server-1#1")
-            vnode_key = f"{node_name}#{i}"
-            h = self._hash(vnode_key)
-            
-            # bisect.insort maintains the list in sorted order (O(N) complexity for insertion).
-            # This is efficient for setup/config changes, but lookups remain fast.
-            bisect.insort(self.ring, h)
-            
-            # Store the mapping from the hash back to the physical node.
-            self.nodes_map[h] = node_name
+        self._bulk_add([node_name])
 
     def remove_node(self, node_name):
         """
         Removes all virtual nodes associated with a physical node.
         (Added this for completeness as it's vital for a dynamic system).
         """
-        for i in range(self.vnodes):
-            h = self._hash(f"{node_name}#{i}")
-            # Find and remove the hash from the ring and the mapping.
-            idx = bisect.bisect_left(self.ring, h)
-            if idx < len(self.ring) and self.ring[idx] == h:
-                self.ring.pop(idx)
-                del self.nodes_map[h]
+        if node_name not in self.node_names:
+            return
+        node_id = self.node_names.index(node_name)
+
+        # Drop every vnode owned by this node with one mask instead of V separate
+        # shifts. No re-hashing needed: owners are stored inline with the ring.
+        # Compressing a sorted array keeps it sorted.
+        keep = self.owners != node_id
+        self.ring = np.compress(keep, self.ring)
+        self.owners = np.compress(keep, self.owners)
+
+        # Close the gap in the id space so ids stay valid indexes into node_names.
+        self.owners[self.owners > node_id] -= 1
+        del self.node_names[node_id]
 
     def get_node(self, key):
         """
         Determines which physical node a specific key (e.g., user_id) belongs to.
         """
-        if not self.ring:
+        if self.ring.size == 0:
             return None
         
         # 1. Hash the incoming key to find its position on the ring.
-        h = self._hash(key)
+        # Wrapping it as np.uint64 up front matters: searching with a plain Python
+        # int makes NumPy infer and convert its dtype on every call (~4x slower).
+        h = np.uint64(self._hash(key))
         
-        # 2. Use binary search (O(log N)) to find the first virtual node hash
+        # 2. Use binary search (O(log N), in C) to find the first virtual node hash
         # that is greater than or equal to the key's hash.
-        idx = bisect.bisect_left(self.ring, h)
+        idx = int(self.ring.searchsorted(h))
         
         # 3. If the index is equal to the length of the ring, it means the key's hash
         # is larger than the largest hash in the ring. Because it's a 'ring',
         # we wrap around to the first node (index 0).
-        idx = idx % len(self.ring)
+        if idx == self.ring.size:
+            idx = 0
         
-        # 4. Return the physical node name associated with that hash.
-        return self.nodes_map[self.ring[idx]]
+        # 4. Return the physical node that owns that hash.
+        return self.node_names[self.owners[idx]]
+
+    def get_nodes_batch(self, keys):
+        """
+        Vectorized get_node: maps a whole list of keys to their physical nodes at once.
+        Hashing still happens per key, but the binary search and the name lookup
+        run as single NumPy calls instead of one interpreter round-trip per key.
+        """
+        if self.ring.size == 0:
+            return np.full(len(keys), None, dtype=object)
+
+        hashes = np.fromiter((self._hash(k) for k in keys), dtype=np.uint64, count=len(keys))
+        idx = np.searchsorted(self.ring, hashes) % self.ring.size
+        # np.fromiter keeps each name as one object, even when it is a tuple
+        names = np.fromiter(self.node_names, dtype=object, count=len(self.node_names))
+        return names[self.owners[idx]]
 
 """
 In a traditional hashing system hash(key) % N, adding one node causes roughly n-1/n (nearly 100%) of the keys to move. In consistent hashing, only about 1/n of the keys should move.
@@ -98,36 +145,39 @@ Why this matters for your System Design ?
 When you run this script, you'll see the disruption is likely around 20-25%.
 - Weighting: In a real-world high-pace startup environment, your servers might not be identical. You can modify add_node to accept a weight parameter. A server with $2\times$ RAM could have vnodes * weight virtual nodes to handle double the traffic.
 - Replication: Consistent hashing only tells you the "Primary" node. For high availability, you usually pick the next $N$ unique nodes clockwise on the ring to store replicas of the data.
-- Collision Handling: While MD5 is stable, it's technically possible (though astronomically rare) for two vnodes to have the same hash. In production code, you should check if h already exists in nodes_map before inserting.
+- Collision Handling: While XXH3 is stable, it's technically possible (though astronomically rare) for two vnodes to have the same hash. In production code, you should check if h already exists on the ring before inserting.
 """
 
 
-def run_simulation():
+def run_simulation(ring_cls=ConsistentHashRing):
+    """
+    Measures how many keys move when a 4th node joins a 3-node cluster.
+    :param ring_cls: Any ring class in this repo taking nodes=[...] (ConsistentHashRing,
+        JumpConsistentHashRing, MaglevHashTable), so every design is measured on the same keys.
+    """
     # 1. Setup initial cluster
     initial_nodes = ["Server_A", "Server_B", "Server_C"]
-    ring = ConsistentHashRing(nodes=initial_nodes, vnodes=100)
+    ring = ring_cls(nodes=initial_nodes)
     
     # 2. Map 10,000 keys to their initial nodes
     total_keys = 10000
-    key_mapping_before = {}
-    for i in range(total_keys):
-        key = f"user_data_key_{i}"
-        key_mapping_before[key] = ring.get_node(key)
+    # Keys are just the integer ids as 8 raw bytes: the benchmark measures the ring,
+    # so building and encoding 10,000 "user_data_key_{i}" strings is pure overhead.
+    # Real callers pass strings; _hash accepts both.
+    keys = [i.to_bytes(8, "little") for i in range(total_keys)]
+    nodes_before = _assign(ring, keys)
         
-    print(f"Initial State: 10,000 keys distributed across {initial_nodes}")
+    print(f"Initial State: 10,000 keys distributed across {initial_nodes} ({ring_cls.__name__})")
     
     # 3. Add a new node (Scaling Up)
     new_node = "Server_D"
     ring.add_node(new_node)
     print(f"Scaling Up: Added {new_node}")
     
-    # 4. Check how many keys moved
-    moved_keys = 0
-    for key, old_node in key_mapping_before.items():
-        new_node_assignment = ring.get_node(key)
-        if new_node_assignment != old_node:
-            moved_keys += 1
-            
+    # 4. Check how many keys moved (one elementwise compare of the two assignments)
+    nodes_after = _assign(ring, keys)
+    moved_keys = int(np.count_nonzero(nodes_before != nodes_after))
+    
     # 5. Report results
     percentage_moved = (moved_keys / total_keys) * 100
     print("-" * 30)
@@ -135,8 +185,15 @@ def run_simulation():
     print(f"Keys Moved: {moved_keys}")
     print(f"Disruption: {percentage_moved:.2f}%")
     
-    # Theoretical disruption for 4 nodes should be ~25% (1/N)
+    # Theoretical disruption for 4 nodes is 1/N = 25% in expectation; a single run
+    # lands near it, not exactly on it.
     # Traditional mod N hashing would have been ~75% to 100%
 
+def _assign(ring, keys):
+    """Maps keys to nodes as an object array, in one call where the ring has a batch lookup."""
+    if hasattr(ring, "get_nodes_batch"):
+        return ring.get_nodes_batch(keys)
+    return np.fromiter((ring.get_node(k) for k in keys), dtype=object, count=len(keys))
+
 if __name__ == "__main__":
-    run_simulation()
\ No newline at end of file
+    run_simulation()
@@ -1,9 +1,12 @@
 """
-It includes MurmurHash3 for entropy, Weighted Nodes for heterogeneous hardware, and a Resilient Cluster Manager to simulate real-world failure and request routing.
+It includes XXH3 for entropy, Weighted Nodes for heterogeneous hardware, and a Resilient Cluster Manager to simulate real-world failure and request routing.
 """
 
-import mmh3
-import bisect
+import itertools
+
+import numpy as np
+
+from ring_hash import ring_hash
 
 class ConsistentHashRing:
     def __init__(self, vnodes=100):
@@ -11,69 +14,85 @@ class ConsistentHashRing:
         :param vnodes: Base number of virtual nodes per physical node.
         """
         self.vnodes = vnodes
-        self.ring = []        # Sorted list of VNode hashes (The Ring)
-        self.nodes_map = {}   # Mapping: Hash -> Physical Node Name
+        self.ring = np.empty(0, dtype=np.uint64)       # Sorted packed VNode hashes (The Ring)
+        self.node_names = []                           # Physical node names; list index = owner id
+        self.owners = np.empty(0, dtype=np.int32)      # Parallel array: owner id of each ring slot
         self.weights = {}     # Track weights for correct removal
 
     def _hash(self, key):
         """High-entropy non-cryptographic hash for speed and distribution."""
-        return mmh3.hash(key)
+        return ring_hash(key)
 
     def add_node(self, node_name, weight=1):
         """Adds a physical node with a specific weight by scaling vnodes."""
         self.weights[node_name] = weight
         effective_vnodes = int(self.vnodes * weight)
         
-        for i in range(effective_vnodes):
-            vnode_key = f"{node_name}#{i}"
-            h = self._hash(vnode_key)
-            
-            # Handle rare hash collisions in the ring
-            while h in self.nodes_map:
-                vnode_key += "_collision"
-                h = self._hash(vnode_key)
-                
-            bisect.insort(self.ring, h)
-            self.nodes_map[h] = node_name
+        # Build every vnode key once up front as raw bytes (name + "#" + 4-byte index),
+        # avoiding per-vnode str formatting and encoding
+        prefix = str(node_name).encode() + b"#"
+        vnode_keys = [prefix + i.to_bytes(4, "little") for i in range(effective_vnodes)]
+        hashes = np.array([self._hash(k) for k in vnode_keys], dtype=np.uint64)
+        
+        # Handle rare hash collisions in the ring: detect them in one vectorized pass
+        # and only walk the keys one by one when there actually is one
+        if np.isin(hashes, self.ring).any() or np.unique(hashes).size != hashes.size:
+            taken = set(self.ring.tolist())
+            for i, vnode_key in enumerate(vnode_keys):
+                h = int(hashes[i])
+                while h in taken:
+                    vnode_key += b"_collision"
+                    h = self._hash(vnode_key)
+                taken.add(h)
+                hashes[i] = h
+
+        # Sort just the new vnodes and merge them into the sorted ring in one O(N + V)
+        # pass (bisect.insort is O(N) per vnode), inserting the owner id alongside.
+        # The id (not the name) goes in the array, so tuple names are never broadcast.
+        hashes.sort()
+        positions = self.ring.searchsorted(hashes)
+        self.ring = np.insert(self.ring, positions, hashes)
+        self.owners = np.insert(self.owners, positions, len(self.node_names))
+        self.node_names.append(node_name)
 
     def remove_node(self, node_name):
         """Dynamically removes all virtual nodes associated with a physical node."""
         if node_name not in self.weights:
             return
         
-        weight = self.weights.pop(node_name)
-        effective_vnodes = int(self.vnodes * weight)
+        self.weights.pop(node_name)
         
-        for i in range(effective_vnodes):
-            vnode_key = f"{node_name}#{i}"
-            h = self._hash(vnode_key)
-            
-            idx = bisect.bisect_left(self.ring, h)
-            # Standard cleanup of the ring and map
-            if idx < len(self.ring) and self.ring[idx] == h:
-                self.ring.pop(idx)
-                self.nodes_map.pop(h, None)
+        # Mark-and-rebuild: one mask over the ring instead of a bisect + pop per vnode.
+        # Owners are stored inline with the ring, so there is no hash map to clean up.
+        node_id = self.node_names.index(node_name)
+        keep = self.owners != node_id
+        self.ring = np.compress(keep, self.ring)
+        self.owners = np.compress(keep, self.owners)
+
+        # Shift the higher ids down so they stay valid indexes into node_names
+        self.owners[self.owners > node_id] -= 1
+        del self.node_names[node_id]
 
     def get_nodes(self, key, n=2):
         """Returns the next 'n' unique physical nodes clockwise on the ring."""
-        if not self.ring: return []
+        if self.ring.size == 0: return []
         
-        h = self._hash(key)
-        start_idx = bisect.bisect_left(self.ring, h)
+        # A np.uint64 scalar skips NumPy's per-call dtype inference for Python ints
+        h = np.uint64(self._hash(key))
+        start_idx = int(self.ring.searchsorted(h))
         
-        targets = []
-        # Linear probe clockwise to find N unique physical nodes
-        for i in range(len(self.ring)):
-            idx = (start_idx + i) % len(self.ring)
-            node_name = self.nodes_map[self.ring[idx]]
-            
-            if node_name not in targets:
-                targets.append(node_name)
+        # There can never be more replicas than physical nodes. Capping n stops the
+        # walk once every node is found instead of circling the whole ring (e.g. after a failure)
+        n = min(n, len(self.weights))
+        
+        targets = {}  # Ordered set: O(1) membership, keeps clockwise order
+        # Walk clockwise from start_idx (wrapping around) to find N unique physical nodes
+        for node_id in itertools.chain(self.owners[start_idx:], self.owners[:start_idx]):
+            targets[node_id] = None
             
             if len(targets) == n:
                 break
-        return targets
-
+        return [self.node_names[node_id] for node_id in targets]
 
 class PhysicalNode:
     """Mock of a physical server instance with local storage."""
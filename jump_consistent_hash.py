@@ -0,0 +1,56 @@
+"""
+Jump Consistent Hash (Lamping & Veach, Google 2014): maps a key to one of N buckets in O(log N) time with zero memory,
+no ring, no vnodes and no binary search. Balance is better than a vnode ring, and growing from N to N+1 buckets moves only ~1/(N+1) of the keys.
+
+Trade-offs vs. the ring in consistent_hashing.py:
+- Buckets are numbered 0..N-1, so nodes can only be appended or removed from the END. Removing a node from the middle
+  would renumber every bucket after it (in practice a failed node is replaced in place, not removed).
+- No per-node weights. A heavier server needs a second layer (e.g. listing it in several buckets).
+"""
+
+import consistent_hashing
+from ring_hash import ring_hash
+
+class JumpConsistentHashRing:
+    def __init__(self, nodes=None):
+        """
+        :param nodes: List of physical node names. A node's position in this list is its bucket number.
+        """
+        self.nodes = list(nodes) if nodes else []
+
+    def _hash(self, key):
+        return ring_hash(key)
+
+    def add_node(self, node_name):
+        """Appends a node as bucket N. Only ~1/(N+1) of the keys move to it."""
+        self.nodes.append(node_name)
+
+    def remove_node(self, node_name):
+        """Removes the last node. Any other node would renumber the buckets after it."""
+        if not self.nodes or self.nodes[-1] != node_name:
+            raise ValueError(f"Jump hash can only remove the last node ({self.nodes[-1:]}), not {node_name!r}")
+        self.nodes.pop()
+
+    def get_node(self, key):
+        """Determines which physical node a key belongs to."""
+        if not self.nodes:
+            return None
+
+        h = self._hash(key)
+        num_buckets = len(self.nodes)
+        b, j = -1, 0
+        # Each step "jumps" forward to the next bucket count at which this key would move.
+        # The last jump that stays below num_buckets is the key's bucket.
+        while j < num_buckets:
+            b = j
+            h = (h * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF # 64-bit LCG step
+            j = int((b + 1) * ((1 << 31) / ((h >> 33) + 1)))
+        return self.nodes[b]
+
+
+def run_simulation():
+    # Same cluster and keys as consistent_hashing.py, so the disruption numbers compare directly
+    consistent_hashing.run_simulation(JumpConsistentHashRing)
+
+if __name__ == "__main__":
+    run_simulation()
@@ -0,0 +1,95 @@
+"""
+Maglev Hashing (Google's network load balancer, 2016): trade a one-off table build for O(1) lookups.
+
+Instead of a ring searched with bisect, every node fills slots of a flat lookup table of prime size M following its own
+permutation of 0..M-1 (derived from two hashes of its name). Nodes take turns claiming their next preferred empty slot,
+so each ends up owning ~M/N slots. A lookup is then just lookup[hash(key) % M]: one modulo and two array reads.
+
+Trade-offs vs. the ring in consistent_hashing.py:
+- Building the table costs O(M log M) and is redone after every add/remove, so this suits read-heavy workloads
+  where lookups vastly outnumber topology changes. The table is built lazily on the first lookup after a change.
+- Disruption on a change can land slightly above the ideal 1/N, in exchange for near-perfect balance.
+"""
+
+import numpy as np
+
+import consistent_hashing
+from ring_hash import ring_hash
+
+def _is_prime(n):
+    if n < 2:
+        return False
+    return all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+class MaglevHashTable:
+    def __init__(self, nodes=None, table_size=65537):
+        """
+        :param nodes: List of physical node names.
+        :param table_size: Number of lookup slots (M). Must be prime, and much larger than the node count.
+        """
+        # A composite M lets some skip share a factor with it; that node's permutation then
+        # cycles through only part of the table and the population loop never terminates.
+        if not _is_prime(table_size):
+            raise ValueError(f"table_size must be prime, got {table_size}")
+        self.table_size = table_size
+        self.node_names = []
+        for node_name in nodes or []:
+            self.add_node(node_name)
+        self.lookup = None # Built lazily; None means "stale, rebuild on next get_node"
+
+    def _hash(self, key, seed=0):
+        return ring_hash(key, seed=seed)
+
+    def add_node(self, node_name):
+        if len(self.node_names) + 1 >= self.table_size:
+            raise ValueError(f"table_size ({self.table_size}) must be larger than the node count")
+        self.node_names.append(node_name)
+        self.lookup = None
+
+    def remove_node(self, node_name):
+        if node_name in self.node_names:
+            self.node_names.remove(node_name)
+            self.lookup = None
+
+    def _build(self):
+        """Runs the Maglev population loop: nodes take turns claiming their next preferred empty slot."""
+        m = self.table_size
+        lookup = np.full(m, -1, dtype=np.int32)
+
+        # Each node's preference list is permutation[j] = (offset + j * skip) % M.
+        # M being prime guarantees every skip in 1..M-1 visits all M slots.
+        offsets = [self._hash(str(name), seed=0) % m for name in self.node_names]
+        skips = [self._hash(str(name), seed=1) % (m - 1) + 1 for name in self.node_names]
+        next_choice = [0] * len(self.node_names)
+
+        filled = 0
+        while filled < m:
+            for i in range(len(self.node_names)):
+                # Walk node i's permutation until it finds a slot nobody has claimed yet
+                slot = (offsets[i] + next_choice[i] * skips[i]) % m
+                while lookup[slot] >= 0:
+                    next_choice[i] += 1
+                    slot = (offsets[i] + next_choice[i] * skips[i]) % m
+                lookup[slot] = i
+                next_choice[i] += 1
+                filled += 1
+                if filled == m:
+                    break
+
+        self.lookup = lookup
+
+    def get_node(self, key):
+        """Determines which physical node a key belongs to in O(1)."""
+        if not self.node_names:
+            return None
+        if self.lookup is None:
+            self._build()
+        return self.node_names[self.lookup[self._hash(key) % self.table_size]]
+
+
+def run_simulation():
+    # Same cluster and keys as consistent_hashing.py, so the disruption numbers compare directly
+    consistent_hashing.run_simulation(MaglevHashTable)
+
+if __name__ == "__main__":
+    run_simulation()
@@ -4,7 +4,10 @@ the data lives directly in the array. We have to handle "tombstones" (deleted ma
 
 class LinearProbingHash:
     def __init__(self, capacity=8):
-        self.capacity = capacity
+        # Round up to a power of two so "hash % capacity" can be "hash & mask"
+        # (a 1-cycle AND instead of a 20-40 cycle integer division)
+        self.capacity = 1 << (max(capacity, 1) - 1).bit_length()
+        self._mask = self.capacity - 1
         self.size = 0
         self.table = [None] * self.capacity # Flat array
 
@@ -12,14 +15,32 @@ class LinearProbingHash:
         if self.size / self.capacity >= 0.75:
             self._resize()
 
-        index = hash(key) % self.capacity
+        # Bind to locals: the probe loop below is the hot path, and local reads
+        # are much cheaper than repeated self.* attribute lookups.
+        table = self.table
+        mask = self._mask
+        index = hash(key) & mask
 
-        # Linear Probing Logic
-        while self.table[index] is not None:
-            if self.table[index][0] == key: # Update existing key
-                self.table[index] = (key, value)
+        # Linear Probing Logic (each slot is read once per probe)
+        slot = table[index]
+        while slot is not None:
+            if slot[0] == key: # Update existing key
+                table[index] = (key, value)
                 return
-            index = (index + 1) % self.capacity # Move to next slot
+            index = (index + 1) & mask # Move to next slot (wraps around)
+            slot = table[index]
         
-        self.table[index] = (key, value)
-        self.size += 1
\ No newline at end of file
+        table[index] = (key, value)
+        self.size += 1
+
+    def _resize(self):
+        old_table = self.table
+        self.capacity *= 2 # Doubling keeps the capacity a power of two
+        self._mask = self.capacity - 1
+        self.table = [None] * self.capacity
+        self.size = 0
+
+        # Rehash every element into the new larger table
+        for entry in old_table:
+            if entry is not None:
+                self.insert(*entry)
@@ -0,0 +1,15 @@
+"""
+The one hash function shared by every ring in this repo (consistent_hashing.py, hashring_simulation.py,
+jump_consistent_hash.py, maglev_hashing.py), so they all place the same key at the same point.
+"""
+
+import xxhash
+
+def ring_hash(key, seed=0):
+    """
+    XXH3 64-bit hash of a key. Bytes-like keys are hashed as-is; str keys are UTF-8 encoded first.
+    Non-cryptographic with high entropy, and (unlike Python's built-in hash()) stable across processes.
+    """
+    if not isinstance(key, (bytes, bytearray, memoryview)):
+        key = key.encode()
+    return xxhash.xxh3_64_intdigest(key, seed=seed)
@@ -5,10 +5,16 @@ This is the "pro" version of Linear Probing. We track the DIB (Distance from Ini
 
 class RobinHoodHash:
     def __init__(self, capacity=8):
-        self.capacity = capacity
+        # Power-of-two capacity, so "% capacity" becomes "& mask" (see open_addressing_linear_probing.py)
+        self.capacity = 1 << (max(capacity, 1) - 1).bit_length()
+        self._mask = self.capacity - 1
         self.size = 0
-        # Store as (key, value, distance_from_home)
-        self.table = [None] * self.capacity
+        # Three parallel arrays instead of one array of (key, value, distance) tuples:
+        # a swap is then plain slot assignments with no tuple allocation, and the
+        # distances sit densely together for the probe loop. dists[i] == -1 means empty.
+        self.keys = [None] * self.capacity
+        self.vals = [None] * self.capacity
+        self.dists = [-1] * self.capacity
 
     def insert(self, key, value):
         if self.size / self.capacity >= 0.75:
@@ -17,31 +23,48 @@ class RobinHoodHash:
         # Initial state of the element we want to insert
         curr_key, curr_val = key, value
         curr_dist = 0
-        index = hash(key) % self.capacity
+        # Bind to locals: the probe loop below is the hot path
+        keys, vals, dists = self.keys, self.vals, self.dists
+        mask = self._mask
+        index = hash(key) & mask
 
         while True:
+            existing_dist = dists[index]
+
             # 1. Found an empty slot? Put it there and exit.
-            if self.table[index] is None:
-                self.table[index] = (curr_key, curr_val, curr_dist)
+            if existing_dist < 0:
+                keys[index], vals[index], dists[index] = curr_key, curr_val, curr_dist
                 self.size += 1
                 return
 
             # 2. Found the same key? Update and exit.
-            if self.table[index][0] == curr_key:
-                self.table[index] = (curr_key, curr_val, curr_dist)
+            if keys[index] == curr_key:
+                vals[index] = curr_val
                 return
 
             # 3. Collision Logic: Who is "poorer"?
-            existing_key, existing_val, existing_dist = self.table[index]
-
             if curr_dist > existing_dist:
                 # The NEW element is further from home than the EXISTING one.
                 # ROB FROM THE RICH: Swap them!
-                self.table[index] = (curr_key, curr_val, curr_dist)
-                
                 # Now we need to find a new home for the displaced element
-                curr_key, curr_val, curr_dist = existing_key, existing_val, existing_dist
+                keys[index], curr_key = curr_key, keys[index]
+                vals[index], curr_val = curr_val, vals[index]
+                dists[index], curr_dist = curr_dist, existing_dist
 
             # Move to the next slot and increment distance
-            index = (index + 1) % self.capacity
-            curr_dist += 1
\ No newline at end of file
+            index = (index + 1) & mask
+            curr_dist += 1
+
+    def _resize(self):
+        old_keys, old_vals, old_dists = self.keys, self.vals, self.dists
+        self.capacity *= 2
+        self._mask = self.capacity - 1
+        self.keys = [None] * self.capacity
+        self.vals = [None] * self.capacity
+        self.dists = [-1] * self.capacity
+        self.size = 0
+
+        # Rehash every element; distances are recomputed against the new capacity
+        for key, value, dist in zip(old_keys, old_vals, old_dists):
+            if dist >= 0:
+                self.insert(key, value)
@@ -2,17 +2,27 @@
 This is the most "stable" version. Even if the hash function is mediocre, the table won't break; it just gets slightly slower.
 """
 
+import itertools
+
+_EMPTY = object() # Marks an unused head slot (None could be a real key)
+
 class ChainingHash:
     def __init__(self, capacity=8):
-        self.capacity = capacity
+        # Power-of-two capacity, so "% capacity" becomes "& mask" (see open_addressing_linear_probing.py)
+        self.capacity = 1 << (max(capacity, 1) - 1).bit_length()
+        self._mask = self.capacity - 1
         self.size = 0
-        # Each bucket is a list (simulating a Linked List)
-        self.table = [[] for _ in range(self.capacity)]
+        # Hybrid layout: the first entry of every bucket lives inline in two flat
+        # arrays, so the common no-collision case never touches a per-bucket list.
+        # Only buckets that actually collide get a chain (simulating a Linked List).
+        self.keys = [_EMPTY] * self.capacity
+        self.vals = [None] * self.capacity
+        self.overflow = {} # index -> [(key, value), ...] beyond the head slot
         self.load_factor_threshold = 0.75
 
     def _hash(self, key):
-        # Using Python's built-in SipHash and modding by capacity
-        return hash(key) % self.capacity
+        # Using Python's built-in SipHash; masking equals "% capacity" for powers of two
+        return hash(key) & self._mask
 
     def insert(self, key, value):
         # 1. Check if we need to resize before adding
@@ -20,25 +30,51 @@ class ChainingHash:
             self._resize()
 
         index = self._hash(key)
-        bucket = self.table[index]
+        head = self.keys[index]
+
+        # 2. Empty bucket: store inline in the flat arrays
+        if head is _EMPTY:
+            self.keys[index] = key
+            self.vals[index] = value
+            self.size += 1
+            return
 
-        # 2. Check if key already exists (Update logic)
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
-                bucket[i] = (key, value)
-                return
+        # 3. Check if key already exists (Update logic)
+        if head == key:
+            self.vals[index] = value
+            return
 
-        # 3. Collision handling: Just append to the list
-        bucket.append((key, value))
+        chain = self.overflow.get(index)
+        if chain is not None:
+            for i, (k, v) in enumerate(chain):
+                if k == key:
+                    chain[i] = (key, value)
+                    return
+
+        # 4. Collision handling: Just append to the bucket's overflow chain
+        self.overflow.setdefault(index, []).append((key, value))
         self.size += 1
 
     def _resize(self):
-        old_table = self.table
+        old_keys, old_vals, old_overflow = self.keys, self.vals, self.overflow
         self.capacity *= 2
-        self.table = [[] for _ in range(self.capacity)]
-        self.size = 0
-        
-        # Rehash every single element into the new larger table
-        for bucket in old_table:
-            for k, v in bucket:
-                self.insert(k, v)
\ No newline at end of file
+        self._mask = self.capacity - 1
+        keys = self.keys = [_EMPTY] * self.capacity
+        vals = self.vals = [None] * self.capacity
+        overflow = self.overflow = {}
+        mask = self._mask
+
+        # Rehash every single element (head slots and chains) into the new larger table.
+        # Keys are already unique, so each one is placed directly: no update scan,
+        # no load-factor check, and self.size stays as it is.
+        entries = itertools.chain(
+            ((k, v) for k, v in zip(old_keys, old_vals) if k is not _EMPTY),
+            (kv for chain in old_overflow.values() for kv in chain),
+        )
+        for k, v in entries:
+            index = hash(k) & mask
+            if keys[index] is _EMPTY:
+                keys[index] = k
+                vals[index] = v
+            else:
+                overflow.setdefault(index, []).append((k, v))